@@ -0,0 +1,121 @@
+import OpenAI from "openai";
+import { NextRequest, NextResponse } from "next/server";
+import { DEFAULT_PROMPT, READING_MODEL } from "@/lib/reading";
+
+// Created on first use so builds don't require OPENAI_API_KEY
+let client: OpenAI | null = null;
+const getClient = () => (client ??= new OpenAI());
+
+// Submit queued captures to the OpenAI Batch API (half price, results within 24h)
+export async function POST(request: NextRequest) {
+  try {
+    const form = await request.formData();
+    const images = form.getAll("image");
+    const timestamps = form.getAll("timestamp");
+    const prompt = form.get("prompt");
+
+    if (images.length === 0) {
+      return NextResponse.json({ error: "No images provided" }, { status: 400 });
+    }
+    if (images.length !== timestamps.length) {
+      return NextResponse.json({ error: "Each image needs a timestamp" }, { status: 400 });
+    }
+
+    // One chat completion request (JSONL line) per capture, keyed by its timestamp
+    const lines: string[] = [];
+    for (let i = 0; i < images.length; i++) {
+      const image = images[i];
+      if (!(image instanceof Blob)) {
+        return NextResponse.json({ error: "Invalid image" }, { status: 400 });
+      }
+      const base64 = Buffer.from(await image.arrayBuffer()).toString("base64");
+      lines.push(
+        JSON.stringify({
+          custom_id: String(timestamps[i]),
+          method: "POST",
+          url: "/v1/chat/completions",
+          body: {
+            model: READING_MODEL,
+            messages: [
+              {
+                role: "user",
+                content: [
+                  {
+                    type: "text",
+                    text: typeof prompt === "string" && prompt ? prompt : DEFAULT_PROMPT,
+                  },
+                  {
+                    type: "image_url",
+                    image_url: {
+                      url: `data:${image.type || "image/jpeg"};base64,${base64}`,
+                      detail: "low",
+                    },
+                  },
+                ],
+              },
+            ],
+          },
+        }) + "\n"
+      );
+    }
+
+    // Upload the lines as File parts rather than joining them into one
+    // string and copying that into a Buffer
+    const file = await getClient().files.create({
+      file: new File(lines, "readings.jsonl", { type: "application/jsonl" }),
+      purpose: "batch",
+    });
+    const batch = await getClient().batches.create({
+      input_file_id: file.id,
+      endpoint: "/v1/chat/completions",
+      completion_window: "24h",
+    });
+
+    return NextResponse.json({ id: batch.id, status: batch.status });
+  } catch (error) {
+    console.error("Error submitting batch:", error);
+    return NextResponse.json(
+      { error: error instanceof Error ? error.message : "Failed to submit batch" },
+      { status: 500 }
+    );
+  }
+}
+
+// Check a batch, returning its readings once it has completed
+export async function GET(request: NextRequest) {
+  try {
+    const id = request.nextUrl.searchParams.get("id");
+    if (!id) {
+      return NextResponse.json({ error: "No batch id provided" }, { status: 400 });
+    }
+
+    const batch = await getClient().batches.retrieve(id);
+    if (batch.status !== "completed") {
+      return NextResponse.json({ status: batch.status });
+    }
+
+    // A batch whose requests all failed completes with only an error file
+    const failed = batch.request_counts?.failed ?? 0;
+    if (!batch.output_file_id) {
+      return NextResponse.json({ status: batch.status, readings: [], failed });
+    }
+
+    const output = await (await getClient().files.content(batch.output_file_id)).text();
+    const readings = output
+      .split("\n")
+      .filter((line) => line.trim())
+      .map((line) => {
+        const result = JSON.parse(line);
+        const text = result.response?.body?.choices?.[0]?.message?.content ?? "";
+        return { timestamp: result.custom_id as string, number: String(text).trim() };
+      });
+
+    return NextResponse.json({ status: batch.status, readings, failed });
+  } catch (error) {
+    console.error("Error checking batch:", error);
+    return NextResponse.json(
+      { error: error instanceof Error ? error.message : "Failed to check batch" },
+      { status: 500 }
+    );
+  }
+}
@@ -1,30 +1,57 @@
-import { openai } from "@ai-sdk/openai";
+import { createOpenAI } from "@ai-sdk/openai";
 import { generateText } from "ai";
 import { NextRequest, NextResponse } from "next/server";
+import { DEFAULT_PROMPT, READING_MODEL } from "@/lib/reading";
 
-const DEFAULT_PROMPT = "This image contains a number (could be a digital display, meter, gauge, thermometer, scale, or any numeric display). Please read and extract the number shown. Respond with ONLY the numeric value (e.g., '37.5' or '123'). Include decimal points if present. If you cannot read the number clearly, respond with 'Unable to read'.";
+// Deadline for each request to OpenAI, so a hung connection can't stall the
+// read queue behind it. gpt-5-mini reasons before answering, and image reads
+// typically take a few seconds with a long tail, so this leaves headroom for
+// slow but healthy responses. The AI SDK treats a timed-out attempt as an
+// abort and doesn't retry it; the one retry only follows a retryable API
+// error (429/5xx). A reading is bounded at about twice this plus the backoff.
+const READ_ATTEMPT_TIMEOUT_MS = 20_000;
+const READ_MAX_RETRIES = 1;
+
+// Applies the deadline per attempt, so a retry after an API error gets a full
+// budget of its own instead of whatever the failed attempt left over
+const openai = createOpenAI({
+  fetch: (input, init) =>
+    fetch(input, {
+      ...init,
+      signal: init?.signal
+        ? AbortSignal.any([init.signal, AbortSignal.timeout(READ_ATTEMPT_TIMEOUT_MS)])
+        : AbortSignal.timeout(READ_ATTEMPT_TIMEOUT_MS),
+    }),
+});
 
 export async function POST(request: NextRequest) {
   try {
-    const { image, prompt } = await request.json();
+    const form = await request.formData();
+    const image = form.get("image");
+    const prompt = form.get("prompt");
 
-    if (!image) {
+    if (!(image instanceof Blob)) {
       return NextResponse.json({ error: "No image provided" }, { status: 400 });
     }
 
     const { text } = await generateText({
-      model: openai("gpt-5-mini"),
+      model: openai(READING_MODEL),
+      maxRetries: READ_MAX_RETRIES,
       messages: [
         {
           role: "user",
           content: [
             {
               type: "text",
-              text: prompt || DEFAULT_PROMPT,
+              text: typeof prompt === "string" && prompt ? prompt : DEFAULT_PROMPT,
             },
             {
               type: "image",
-              image: image,
+              image: new Uint8Array(await image.arrayBuffer()),
+              mediaType: image.type || "image/jpeg",
+              providerOptions: {
+                openai: { imageDetail: "low" },
+              },
             },
           ],
         },
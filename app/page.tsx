@@ -1,6 +1,8 @@
 "use client";
 
-import { useState, useRef, useEffect, useCallback } from "react";
+import { useState, useRef, useEffect, useCallback, useMemo } from "react";
+import { DEFAULT_PROMPT } from "@/lib/reading";
+import { startTicker } from "@/lib/ticker";
 
 interface CropRegion {
   x: number;
@@ -14,6 +16,144 @@ interface Reading {
   value: string;
 }
 
+// Longest side (px) of the image sent to the vision model. The API tiles
+// low-detail images at 512px, so anything larger only costs upload time.
+const MAX_IMAGE_DIM = 512;
+const JPEG_QUALITY = 0.75;
+
+// Client-side cap on a live reading request; a little above the server's own
+// worst case (an API error, backoff, then a retry that hits its 20s deadline)
+// so the server's error normally arrives first
+const REQUEST_TIMEOUT_MS = 45_000;
+
+// Batch mode: captures queued before submitting to the Batch API, and how
+// often submitted batches are checked for results
+const BATCH_SIZE = 20;
+const BATCH_POLL_INTERVAL_MS = 60_000;
+
+// Most recent readings listed in the history table; the chart and CSV
+// always cover the full history
+const MAX_TABLE_ROWS = 200;
+
+// Pending localStorage writes are flushed at most this often
+const STORAGE_FLUSH_DELAY_MS = 2000;
+
+// Parsed chart coordinates per reading. History updates append to (or
+// re-sort) the same Reading objects, so each one is parsed only once.
+const chartPoints = new WeakMap<Reading, { time: number; value: number }>();
+
+function chartPoint(reading: Reading): { time: number; value: number } {
+  let point = chartPoints.get(reading);
+  if (!point) {
+    point = { time: new Date(reading.timestamp).getTime(), value: parseFloat(reading.value) };
+    chartPoints.set(reading, point);
+  }
+  return point;
+}
+
+// Column buffers for the chart (parsed values/times and projected x/y),
+// reused across redraws and grown by doubling as the history grows
+let chartBuffers = {
+  values: new Float64Array(0),
+  times: new Float64Array(0),
+  xs: new Float64Array(0),
+  ys: new Float64Array(0),
+};
+
+function chartSeries(count: number): typeof chartBuffers {
+  if (chartBuffers.values.length < count) {
+    const capacity = Math.max(64, 2 ** Math.ceil(Math.log2(count)));
+    chartBuffers = {
+      values: new Float64Array(capacity),
+      times: new Float64Array(capacity),
+      xs: new Float64Array(capacity),
+      ys: new Float64Array(capacity),
+    };
+  }
+  return chartBuffers;
+}
+
+// Longest to wait for a new camera frame before capturing anyway; hidden tabs
+// don't present video frames at all
+const FRESH_FRAME_TIMEOUT_MS = 100;
+
+// Resolve once the video presents its next frame, so a capture never uses a
+// stale frame (e.g. one held over from before the tab was throttled)
+function waitForFreshFrame(video: HTMLVideoElement): Promise<void> {
+  const { requestVideoFrameCallback } = video as HTMLVideoElement & {
+    requestVideoFrameCallback?: (callback: () => void) => number;
+  };
+  if (!requestVideoFrameCallback) return Promise.resolve();
+
+  return new Promise((resolve) => {
+    const timeout = window.setTimeout(resolve, FRESH_FRAME_TIMEOUT_MS);
+    requestVideoFrameCallback.call(video, () => {
+      clearTimeout(timeout);
+      resolve();
+    });
+  });
+}
+
+// Thousands separators, e.g. the commas in "12,345.6", dropped before matching
+const GROUP_SEPARATOR_RE = /(\d),(?=\d{3}(?!\d))/g;
+
+// First whole number in a model response, e.g. "37.5" from "37.5°C" or
+// ".5" from "Reading: .5". Malformed runs like "1.2.3" or "1,23" don't match
+// at all, rather than yielding a truncated "1.2" or "1".
+const NUMBER_RE = /(?:^|[^\d.,])([-+]?(?:\d+(?:\.\d+)?|\.\d+))(?![.,]?\d)/;
+
+// Extract the numeric reading from a model response, or null if there is none
+function parseReading(text: string): string | null {
+  const match = NUMBER_RE.exec(text.replace(GROUP_SEPARATOR_RE, "$1"));
+  return match ? match[1] : null;
+}
+
+// Frames whose 32x32 grayscale thumbnail differs from the last read frame by
+// less than this mean absolute difference (0-255 scale) are treated as
+// unchanged and reuse its reading. A small change, like one segment of a digit
+// on a loosely cropped display, can stay under the threshold, so a real read
+// is forced after THUMB_MAX_REUSES consecutive reuses.
+const THUMB_SIZE = 32;
+const THUMB_DIFF_THRESHOLD = 3;
+const THUMB_MAX_REUSES = 5;
+
+// Thumbnail canvas reused by every frameThumbnail call; created on first use
+// since this module also renders on the server
+let thumbContext: CanvasRenderingContext2D | null = null;
+
+function getThumbContext(): CanvasRenderingContext2D | null {
+  if (!thumbContext) {
+    const thumb = document.createElement("canvas");
+    thumb.width = THUMB_SIZE;
+    thumb.height = THUMB_SIZE;
+    thumbContext = thumb.getContext("2d", { willReadFrequently: true });
+  }
+  return thumbContext;
+}
+
+// THUMB_SIZE x THUMB_SIZE grayscale thumbnail of an image, or null if the
+// thumbnail canvas is unavailable
+function frameThumbnail(source: HTMLCanvasElement): Uint8Array | null {
+  const ctx = getThumbContext();
+  if (!ctx) return null;
+
+  ctx.drawImage(source, 0, 0, THUMB_SIZE, THUMB_SIZE);
+  const { data } = ctx.getImageData(0, 0, THUMB_SIZE, THUMB_SIZE);
+  const gray = new Uint8Array(THUMB_SIZE * THUMB_SIZE);
+  for (let i = 0; i < gray.length; i++) {
+    gray[i] = (77 * data[i * 4] + 150 * data[i * 4 + 1] + 29 * data[i * 4 + 2]) >> 8;
+  }
+  return gray;
+}
+
+function meanAbsDiff(a: Uint8Array, b: Uint8Array): number {
+  let sum = 0;
+  for (let i = 0; i < a.length; i++) {
+    sum += Math.abs(a[i] - b[i]);
+  }
+  return sum / a.length;
+}
+
 export default function Home() {
   const videoRef = useRef<HTMLVideoElement>(null);
   const canvasRef = useRef<HTMLCanvasElement>(null);
@@ -28,7 +168,46 @@ export default function Home() {
   const [interval, setIntervalSeconds] = useState(5);
   const [showSettings, setShowSettings] = useState(false);
 
-  const DEFAULT_PROMPT = "This image contains a number (could be a digital display, meter, gauge, thermometer, scale, or any numeric display). Please read and extract the number shown. Respond with ONLY the numeric value (e.g., '37.5' or '123'). Include decimal points if present. If you cannot read the number clearly, respond with 'Unable to read'.";
+  // Pending localStorage writes by key. Frequent updates (every reading,
+  // every keystroke in the prompt) are coalesced into one write per key
+  // instead of each doing synchronous storage I/O, and serialization is
+  // deferred until the write actually happens.
+  const pendingWritesRef = useRef(new Map<string, () => string>());
+  const flushTimerRef = useRef<number | null>(null);
+  const flushStorage = useCallback(() => {
+    if (flushTimerRef.current !== null) {
+      clearTimeout(flushTimerRef.current);
+      flushTimerRef.current = null;
+    }
+    for (const [key, serialize] of pendingWritesRef.current) {
+      localStorage.setItem(key, serialize());
+    }
+    pendingWritesRef.current.clear();
+  }, []);
+
+  const scheduleWrite = useCallback(
+    (key: string, serialize: () => string) => {
+      pendingWritesRef.current.set(key, serialize);
+      if (flushTimerRef.current === null) {
+        flushTimerRef.current = window.setTimeout(flushStorage, STORAGE_FLUSH_DELAY_MS);
+      }
+    },
+    [flushStorage]
+  );
+
+  // Flush pending writes before the page is hidden or closed
+  useEffect(() => {
+    const handleVisibilityChange = () => {
+      if (document.visibilityState === "hidden") flushStorage();
+    };
+    window.addEventListener("pagehide", flushStorage);
+    document.addEventListener("visibilitychange", handleVisibilityChange);
+    return () => {
+      window.removeEventListener("pagehide", flushStorage);
+      document.removeEventListener("visibilitychange", handleVisibilityChange);
+      flushStorage();
+    };
+  }, [flushStorage]);
 
   // Custom prompt - initialize from localStorage
   const [prompt, setPrompt] = useState<string>(() => {
@@ -43,8 +222,8 @@ export default function Home() {
 
   // Save prompt to localStorage whenever it changes
   useEffect(() => {
-    localStorage.setItem("readoutcam-prompt", prompt);
-  }, [prompt]);
+    scheduleWrite("readoutcam-prompt", () => prompt);
+  }, [prompt, scheduleWrite]);
 
   // Reading history for CSV export - initialize from localStorage
   const [readings, setReadings] = useState<Reading[]>(() => {
@@ -63,8 +242,8 @@ export default function Home() {
 
   // Save readings to localStorage whenever they change
   useEffect(() => {
-    localStorage.setItem("readoutcam-readings", JSON.stringify(readings));
-  }, [readings]);
+    scheduleWrite("readoutcam-readings", () => JSON.stringify(readings));
+  }, [readings, scheduleWrite]);
 
   // Reset readings
   const resetReadings = () => {
@@ -72,6 +251,127 @@ export default function Home() {
     setResult(null);
   };
 
+  // Batch mode - queue captures for the Batch API instead of reading live
+  const [batchMode, setBatchMode] = useState(false);
+  const pendingBatchRef = useRef<{ timestamp: string; blob: Blob }[]>([]);
+  const [pendingCount, setPendingCount] = useState(0);
+
+  // Submitted batch ids awaiting results - initialize from localStorage
+  const [batchJobs, setBatchJobs] = useState<string[]>(() => {
+    if (typeof window !== "undefined") {
+      const saved = localStorage.getItem("readoutcam-batches");
+      if (saved) {
+        try {
+          return JSON.parse(saved);
+        } catch {
+          return [];
+        }
+      }
+    }
+    return [];
+  });
+
+  // Save batch ids to localStorage whenever they change
+  useEffect(() => {
+    scheduleWrite("readoutcam-batches", () => JSON.stringify(batchJobs));
+  }, [batchJobs, scheduleWrite]);
+
+  // Queued captures live only in memory, so ask before the page is closed or
+  // reloaded while any are waiting to be submitted
+  useEffect(() => {
+    if (pendingCount === 0) return;
+    const handleBeforeUnload = (e: BeforeUnloadEvent) => {
+      e.preventDefault();
+    };
+    window.addEventListener("beforeunload", handleBeforeUnload);
+    return () => window.removeEventListener("beforeunload", handleBeforeUnload);
+  }, [pendingCount]);
+
+  // Submit queued captures, at most BATCH_SIZE per batch so a backlog left by
+  // failed submits never grows into one oversized upload
+  const submitBatch = useCallback(async () => {
+    while (pendingBatchRef.current.length > 0) {
+      const pending = pendingBatchRef.current.splice(0, BATCH_SIZE);
+      setPendingCount(pendingBatchRef.current.length);
+
+      const body = new FormData();
+      body.append("prompt", prompt);
+      for (const { timestamp, blob } of pending) {
+        body.append("image", blob, "capture.jpg");
+        body.append("timestamp", timestamp);
+      }
+
+      try {
+        const response = await fetch("/api/batch", { method: "POST", body });
+        const data = await response.json();
+        if (!response.ok) {
+          throw new Error(data.error || "Failed to submit batch");
+        }
+        setBatchJobs((prev) => [...prev, data.id]);
+      } catch (err) {
+        // Put the captures back so they can be resubmitted
+        pendingBatchRef.current = [...pending, ...pendingBatchRef.current];
+        setPendingCount(pendingBatchRef.current.length);
+        setError(`Batch error: ${err instanceof Error ? err.message : "Unknown error"}`);
+        return;
+      }
+    }
+  }, [prompt]);
+
+  // Poll submitted batches and merge their readings into the history
+  useEffect(() => {
+    if (batchJobs.length === 0) return;
+
+    // Set on cleanup: a poll still awaiting when batchJobs changes must not
+    // merge results, or the new effect's poll would merge the same batch again
+    let cancelled = false;
+
+    const poll = async () => {
+      for (const id of batchJobs) {
+        try {
+          const response = await fetch(`/api/batch?id=${encodeURIComponent(id)}`);
+          const data = await response.json();
+          if (cancelled) return;
+          if (!response.ok) {
+            throw new Error(data.error || "Failed to check batch");
+          }
+
+          if (data.status === "completed") {
+            const batchReadings: Reading[] = [];
+            for (const { timestamp, number } of data.readings ?? []) {
+              const value = parseReading(number);
+              if (value !== null) {
+                batchReadings.push({ timestamp, value });
+              }
+            }
+            setReadings((prev) =>
+              [...prev, ...batchReadings].sort((a, b) => a.timestamp.localeCompare(b.timestamp))
+            );
+            setBatchJobs((prev) => prev.filter((job) => job !== id));
+            if (data.failed > 0) {
+              setError(`Batch ${id}: ${data.failed} of its captures could not be read`);
+            }
+          } else if (["failed", "expired", "cancelled"].includes(data.status)) {
+            setError(`Batch ${id} ${data.status}`);
+            setBatchJobs((prev) => prev.filter((job) => job !== id));
+          }
+        } catch (err) {
+          console.error(err);
+        }
+      }
+    };
+
+    poll();
+    const id = window.setInterval(poll, BATCH_POLL_INTERVAL_MS);
+    return () => {
+      cancelled = true;
+      clearInterval(id);
+    };
+  }, [batchJobs]);
+
+  // Last successful reading and the thumbnail of the frame it was read from
+  const lastReadRef = useRef<{ thumb: Uint8Array; number: string; reuses: number } | null>(null);
+
   // Crop region state
   const [cropRegion, setCropRegion] = useState<CropRegion | null>(null);
   const [isSelecting, setIsSelecting] = useState(false);
@@ -82,7 +382,15 @@ export default function Home() {
   const startCamera = async () => {
     try {
       const stream = await navigator.mediaDevices.getUserMedia({
-        video: { facingMode: "environment", width: { ideal: 1280 }, height: { ideal: 720 } },
+        // Cap the frame rate: the preview needs ~30fps and reads happen every
+        // few seconds, so higher camera rates only cost decode and USB bandwidth.
+        // 960x540 leaves headroom over the 512px image sent to the model.
+        video: {
+          facingMode: "environment",
+          width: { ideal: 960 },
+          height: { ideal: 540 },
+          frameRate: { ideal: 30, max: 30 },
+        },
         audio: false,
       });
       if (videoRef.current) {
@@ -120,9 +428,15 @@ export default function Home() {
     };
   };
 
+  // Latest selection end from mousemove; state is only updated once per
+  // animation frame since every update re-renders the page
+  const pendingSelectionEndRef = useRef<{ x: number; y: number } | null>(null);
+  const selectionFrameRef = useRef<number | null>(null);
+
   // Mouse handlers for crop selection
   const handleMouseDown = (e: React.MouseEvent) => {
     const pos = getRelativePosition(e);
+    pendingSelectionEndRef.current = pos;
     setIsSelecting(true);
     setSelectionStart(pos);
     setSelectionEnd(pos);
@@ -131,12 +445,24 @@ export default function Home() {
 
   const handleMouseMove = (e: React.MouseEvent) => {
     if (!isSelecting) return;
-    setSelectionEnd(getRelativePosition(e));
+    pendingSelectionEndRef.current = getRelativePosition(e);
+    if (selectionFrameRef.current === null) {
+      selectionFrameRef.current = requestAnimationFrame(() => {
+        selectionFrameRef.current = null;
+        setSelectionEnd(pendingSelectionEndRef.current);
+      });
+    }
   };
 
   const handleMouseUp = () => {
+    const selectionEnd = pendingSelectionEndRef.current;
     if (!isSelecting || !selectionStart || !selectionEnd) return;
     setIsSelecting(false);
+    if (selectionFrameRef.current !== null) {
+      cancelAnimationFrame(selectionFrameRef.current);
+      selectionFrameRef.current = null;
+    }
+    pendingSelectionEndRef.current = null;
 
     const x = Math.min(selectionStart.x, selectionEnd.x);
     const y = Math.min(selectionStart.y, selectionEnd.y);
@@ -151,43 +477,120 @@ export default function Home() {
   };
 
   // Capture frame and send to API
-  const captureAndRead = useCallback(async () => {
-    if (!videoRef.current || !canvasRef.current || loading) return;
+  const readFrame = useCallback(async () => {
+    if (!videoRef.current || !canvasRef.current) return;
 
     const video = videoRef.current;
     const canvas = canvasRef.current;
-    const ctx = canvas.getContext("2d");
+    // Opaque context: JPEG has no alpha channel, so this spares the encoder
+    // an un-premultiply pass over every pixel
+    const ctx = canvas.getContext("2d", { alpha: false });
     if (!ctx) return;
 
-    // Set canvas size based on crop or full video
-    if (cropRegion) {
-      canvas.width = cropRegion.width;
-      canvas.height = cropRegion.height;
+    await waitForFreshFrame(video);
+
+    // Nothing to capture, e.g. a queued read after the camera was stopped;
+    // createImageBitmap would reject on an empty video
+    if (video.readyState < HTMLMediaElement.HAVE_CURRENT_DATA) return;
+
+    // Downscale the crop (or full frame) so its longest side fits the
+    // vision payload budget before encoding
+    const source = cropRegion ?? { x: 0, y: 0, width: video.videoWidth, height: video.videoHeight };
+    const scale = Math.min(1, MAX_IMAGE_DIM / Math.max(source.width, source.height));
+    const width = Math.round(source.width * scale);
+    const height = Math.round(source.height * scale);
+    if (!width || !height) return;
+
+    // Crop and scale asynchronously via createImageBitmap where available,
+    // so the main thread only copies an already target-sized bitmap. Frames
+    // that already fit the budget are passed through without resampling;
+    // larger ones use high-quality (area-style) filtering to keep digits legible.
+    const frame =
+      typeof createImageBitmap === "function"
+        ? await createImageBitmap(
+            video,
+            source.x,
+            source.y,
+            source.width,
+            source.height,
+            scale < 1
+              ? { resizeWidth: width, resizeHeight: height, resizeQuality: "high" }
+              : undefined
+          )
+        : null;
+
+    // Only resize when the target changes: assigning width/height reallocates
+    // and clears the backing store, and the draw below covers it completely
+    if (canvas.width !== width || canvas.height !== height) {
+      canvas.width = width;
+      canvas.height = height;
+    }
+    if (frame) {
+      ctx.drawImage(frame, 0, 0, width, height);
+      frame.close();
+    } else {
+      ctx.imageSmoothingQuality = "high";
       ctx.drawImage(
         video,
-        cropRegion.x,
-        cropRegion.y,
-        cropRegion.width,
-        cropRegion.height,
+        source.x,
+        source.y,
+        source.width,
+        source.height,
         0,
         0,
-        cropRegion.width,
-        cropRegion.height
+        width,
+        height
       );
-    } else {
-      canvas.width = video.videoWidth;
-      canvas.height = video.videoHeight;
-      ctx.drawImage(video, 0, 0);
     }
 
-    const imageData = canvas.toDataURL("image/jpeg", 0.9);
+    // Reuse the previous live reading if the frame hasn't visibly changed.
+    // Batch mode queues every capture, since its readings arrive much later.
+    const thumb = frameThumbnail(canvas);
+    const lastRead = lastReadRef.current;
+    if (
+      !batchMode &&
+      thumb &&
+      lastRead &&
+      lastRead.reuses < THUMB_MAX_REUSES &&
+      meanAbsDiff(thumb, lastRead.thumb) < THUMB_DIFF_THRESHOLD
+    ) {
+      lastRead.reuses++;
+      setResult(lastRead.number);
+      setReadings((prev) => [
+        ...prev,
+        { timestamp: new Date().toISOString(), value: lastRead.number },
+      ]);
+      return;
+    }
 
     setLoading(true);
     try {
+      // Encode asynchronously and upload the raw JPEG bytes, which avoids
+      // building a base64 data URL on the main thread
+      const blob = await new Promise<Blob | null>((resolve) =>
+        canvas.toBlob(resolve, "image/jpeg", JPEG_QUALITY)
+      );
+      if (!blob) {
+        throw new Error("Failed to encode image");
+      }
+
+      // In batch mode, queue the capture and submit once enough accumulate
+      if (batchMode) {
+        pendingBatchRef.current.push({ timestamp: new Date().toISOString(), blob });
+        setPendingCount(pendingBatchRef.current.length);
+        if (pendingBatchRef.current.length >= BATCH_SIZE) {
+          submitBatch();
+        }
+        return;
+      }
+
+      const body = new FormData();
+      body.append("image", blob, "capture.jpg");
+      body.append("prompt", prompt);
       const response = await fetch("/api/read-number", {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ image: imageData, prompt }),
+        body,
+        signal: AbortSignal.timeout(REQUEST_TIMEOUT_MS),
       });
 
       const data = await response.json();
@@ -197,11 +600,12 @@ export default function Home() {
       setResult(data.number);
 
       // Save reading to history
-      const numericValue = parseFloat(data.number);
-      if (!isNaN(numericValue)) {
+      const value = parseReading(data.number);
+      if (value !== null) {
+        lastReadRef.current = thumb ? { thumb, number: value, reuses: 0 } : null;
         setReadings((prev) => [
           ...prev,
-          { timestamp: new Date().toISOString(), value: data.number },
+          { timestamp: new Date().toISOString(), value },
         ]);
       }
     } catch (err) {
@@ -209,156 +613,273 @@ export default function Home() {
     } finally {
       setLoading(false);
     }
-  }, [cropRegion, loading, prompt]);
+  }, [batchMode, cropRegion, prompt, submitBatch]);
+
+  // Reads run one at a time with a single-slot queue behind them: an
+  // auto-read tick that arrives mid-read queues exactly one follow-up read,
+  // and further ticks share that queued read instead of piling up. Not
+  // depending on `loading` also keeps the auto-read timer from restarting
+  // every time a read starts or finishes.
+  const inFlightRef = useRef<Promise<void> | null>(null);
+  const queuedRef = useRef<Promise<void> | null>(null);
+  // Bumped when auto-read stops, so a read queued before then never starts
+  const queueGenerationRef = useRef(0);
+  const captureAndRead = useCallback((): Promise<void> => {
+    if (!inFlightRef.current) {
+      inFlightRef.current = readFrame().finally(() => {
+        inFlightRef.current = null;
+      });
+      return inFlightRef.current;
+    }
+
+    if (!queuedRef.current) {
+      // Run the queued read with the latest callback, since the prompt or
+      // crop may have changed while waiting
+      const generation = queueGenerationRef.current;
+      const runQueued = () => {
+        if (generation !== queueGenerationRef.current) return;
+        queuedRef.current = null;
+        return captureAndReadRef.current();
+      };
+      queuedRef.current = inFlightRef.current.then(runQueued, runQueued);
+    }
+    return queuedRef.current;
+  }, [readFrame]);
+
+  // Latest captureAndRead for the auto-read scheduler, which reads it through
+  // this ref instead of depending on it. Otherwise every prompt keystroke,
+  // crop change or batch toggle would tear down and restart the schedule.
+  const captureAndReadRef = useRef(captureAndRead);
+  useEffect(() => {
+    captureAndReadRef.current = captureAndRead;
+  }, [captureAndRead]);
+
+  // A new crop, prompt or read mode invalidates the cached reading
+  useEffect(() => {
+    lastReadRef.current = null;
+  }, [batchMode, cropRegion, prompt]);
 
   // Start camera on mount
   useEffect(() => {
     startCamera();
   }, []);
 
-  // Auto-read interval
+  // Auto-read interval, scheduled against monotonic deadlines so timer
+  // lateness doesn't accumulate. Slots missed while the tab was throttled or
+  // the machine slept are skipped rather than fired back to back. The
+  // schedule runs in a worker where available, so main-thread work and
+  // background-tab timer throttling don't delay the reading cadence.
   useEffect(() => {
     if (!autoRead || !streaming) return;
 
-    const id = window.setInterval(() => {
-      captureAndRead();
-    }, interval * 1000);
+    const period = interval * 1000;
+    const onTick = () => captureAndReadRef.current();
+
+    if (typeof Worker !== "undefined") {
+      try {
+        const worker = new Worker(new URL("./ticker.worker.ts", import.meta.url));
+        let stop = () => worker.terminate();
+        // A worker script that fails to load reports it here rather than by
+        // throwing from the constructor; use the timer instead
+        worker.onerror = () => {
+          worker.terminate();
+          stop = startTicker(period, onTick);
+        };
+        worker.onmessage = onTick;
+        worker.postMessage(period);
+        return () => stop();
+      } catch {
+        // Fall through to the timer below
+      }
+    }
+
+    return startTicker(period, onTick);
+  }, [autoRead, streaming, interval]);
 
-    return () => clearInterval(id);
-  }, [autoRead, streaming, interval, captureAndRead]);
+  // Stopping auto-read, changing its interval or stopping the camera drops a
+  // read still queued behind the in-flight one, so no paid read runs after
+  useEffect(() => {
+    if (!autoRead || !streaming) return;
+    return () => {
+      queueGenerationRef.current++;
+      queuedRef.current = null;
+    };
+  }, [autoRead, streaming, interval]);
 
-  // Draw chart when readings change
+  // Draw chart when readings change. Drawing waits for the next animation
+  // frame, so readings that arrive while the tab is hidden don't redraw an
+  // unseen chart, and several updates in one frame draw once.
   useEffect(() => {
     if (!chartRef.current || readings.length < 2) return;
 
-    const canvas = chartRef.current;
-    const ctx = canvas.getContext("2d");
-    if (!ctx) return;
+    const frame = requestAnimationFrame(() => {
+      if (!chartRef.current) return;
+      const canvas = chartRef.current;
+      const ctx = canvas.getContext("2d");
+      if (!ctx) return;
+
+      // Resize the backing store only when the layout size changes;
+      // assigning width/height reallocates it even when unchanged
+      const rect = canvas.getBoundingClientRect();
+      const dpr = window.devicePixelRatio;
+      const backingWidth = Math.round(rect.width * dpr);
+      const backingHeight = Math.round(rect.height * dpr);
+      if (canvas.width !== backingWidth || canvas.height !== backingHeight) {
+        canvas.width = backingWidth;
+        canvas.height = backingHeight;
+      }
+      ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+
+      const width = rect.width;
+      const height = rect.height;
+      const padding = { top: 20, right: 20, bottom: 30, left: 50 };
+      const chartWidth = width - padding.left - padding.right;
+      const chartHeight = height - padding.top - padding.bottom;
+
+      // Clear canvas
+      ctx.fillStyle = "#fafafa";
+      ctx.fillRect(0, 0, width, height);
+
+      // Parse values and times in a single pass, reusing cached points so
+      // only readings added since the last redraw are parsed
+      const count = readings.length;
+      const { values, times, xs, ys } = chartSeries(count);
+      let minVal = Infinity;
+      let maxVal = -Infinity;
+      for (let i = 0; i < count; i++) {
+        const point = chartPoint(readings[i]);
+        values[i] = point.value;
+        times[i] = point.time;
+        if (values[i] < minVal) minVal = values[i];
+        if (values[i] > maxVal) maxVal = values[i];
+      }
+      const range = maxVal - minVal || 1;
+
+      const startTime = times[0];
+      const endTime = times[count - 1];
+      const timeRange = endTime - startTime || 1;
+      const maxMinutes = (endTime - startTime) / 60000;
+
+      // Draw grid lines
+      ctx.strokeStyle = "#e5e5e5";
+      ctx.lineWidth = 1;
+      for (let i = 0; i <= 4; i++) {
+        const y = padding.top + (chartHeight * i) / 4;
+        ctx.beginPath();
+        ctx.moveTo(padding.left, y);
+        ctx.lineTo(width - padding.right, y);
+        ctx.stroke();
+
+        // Y-axis labels
+        const val = maxVal - (range * i) / 4;
+        ctx.fillStyle = "#737373";
+        ctx.font = "12px system-ui, -apple-system, sans-serif";
+        ctx.textAlign = "right";
+        // Use appropriate formatting based on value magnitude
+        const absVal = Math.abs(val);
+        let label: string;
+        if (absVal === 0) {
+          label = "0";
+        } else if (absVal < 0.001 || absVal >= 10000) {
+          label = val.toExponential(2);
+        } else if (absVal < 1) {
+          label = val.toPrecision(3);
+        } else {
+          label = val.toFixed(1);
+        }
+        ctx.fillText(label, padding.left - 8, y + 4);
+      }
+
+      // Project points to canvas coordinates once, shared by line and markers
+      for (let i = 0; i < count; i++) {
+        xs[i] = padding.left + ((times[i] - startTime) / timeRange) * chartWidth;
+        ys[i] = padding.top + ((maxVal - values[i]) / range) * chartHeight;
+      }
 
-    // Set canvas size
-    const rect = canvas.getBoundingClientRect();
-    canvas.width = rect.width * window.devicePixelRatio;
-    canvas.height = rect.height * window.devicePixelRatio;
-    ctx.scale(window.devicePixelRatio, window.devicePixelRatio);
-
-    const width = rect.width;
-    const height = rect.height;
-    const padding = { top: 20, right: 20, bottom: 30, left: 50 };
-    const chartWidth = width - padding.left - padding.right;
-    const chartHeight = height - padding.top - padding.bottom;
-
-    // Clear canvas
-    ctx.fillStyle = "#fafafa";
-    ctx.fillRect(0, 0, width, height);
-
-    // Parse values and times
-    const values = readings.map((r) => parseFloat(r.value));
-    const times = readings.map((r) => new Date(r.timestamp).getTime());
-    const minVal = Math.min(...values);
-    const maxVal = Math.max(...values);
-    const range = maxVal - minVal || 1;
-
-    const startTime = times[0];
-    const endTime = times[times.length - 1];
-    const timeRange = endTime - startTime || 1;
-    const maxMinutes = (endTime - startTime) / 60000;
-
-    // Draw grid lines
-    ctx.strokeStyle = "#e5e5e5";
-    ctx.lineWidth = 1;
-    for (let i = 0; i <= 4; i++) {
-      const y = padding.top + (chartHeight * i) / 4;
+      // Draw line
+      ctx.strokeStyle = "#000";
+      ctx.lineWidth = 1.5;
       ctx.beginPath();
-      ctx.moveTo(padding.left, y);
-      ctx.lineTo(width - padding.right, y);
+      ctx.moveTo(xs[0], ys[0]);
+      for (let i = 1; i < count; i++) {
+        ctx.lineTo(xs[i], ys[i]);
+      }
       ctx.stroke();
 
-      // Y-axis labels
-      const val = maxVal - (range * i) / 4;
-      ctx.fillStyle = "#737373";
-      ctx.font = "12px system-ui, -apple-system, sans-serif";
-      ctx.textAlign = "right";
-      // Use appropriate formatting based on value magnitude
-      const absVal = Math.abs(val);
-      let label: string;
-      if (absVal === 0) {
-        label = "0";
-      } else if (absVal < 0.001 || absVal >= 10000) {
-        label = val.toExponential(2);
-      } else if (absVal < 1) {
-        label = val.toPrecision(3);
-      } else {
-        label = val.toFixed(1);
+      // Draw points as a single path
+      ctx.fillStyle = "#000";
+      ctx.beginPath();
+      for (let i = 0; i < count; i++) {
+        ctx.moveTo(xs[i] + 3, ys[i]);
+        ctx.arc(xs[i], ys[i], 3, 0, Math.PI * 2);
       }
-      ctx.fillText(label, padding.left - 8, y + 4);
-    }
-
-    // Draw line
-    ctx.strokeStyle = "#000";
-    ctx.lineWidth = 1.5;
-    ctx.beginPath();
-
-    readings.forEach((reading, i) => {
-      const timeOffset = times[i] - startTime;
-      const x = padding.left + (timeOffset / timeRange) * chartWidth;
-      const y = padding.top + ((maxVal - parseFloat(reading.value)) / range) * chartHeight;
+      ctx.fill();
 
-      if (i === 0) {
-        ctx.moveTo(x, y);
-      } else {
-        ctx.lineTo(x, y);
+      // X-axis labels (time in minutes)
+      ctx.fillStyle = "#737373";
+      ctx.font = "12px system-ui, -apple-system, sans-serif";
+      ctx.textAlign = "center";
+
+      // Draw a few time labels
+      const numLabels = Math.min(5, Math.ceil(maxMinutes) + 1);
+      for (let i = 0; i < numLabels; i++) {
+        const minutes = (maxMinutes * i) / (numLabels - 1);
+        const x = padding.left + (i / (numLabels - 1)) * chartWidth;
+        ctx.fillText(`${minutes.toFixed(1)}m`, x, height - 8);
       }
     });
-    ctx.stroke();
-
-    // Draw points
-    ctx.fillStyle = "#000";
-    readings.forEach((reading, i) => {
-      const timeOffset = times[i] - startTime;
-      const x = padding.left + (timeOffset / timeRange) * chartWidth;
-      const y = padding.top + ((maxVal - parseFloat(reading.value)) / range) * chartHeight;
-      ctx.beginPath();
-      ctx.arc(x, y, 3, 0, Math.PI * 2);
-      ctx.fill();
-    });
 
-    // X-axis labels (time in minutes)
-    ctx.fillStyle = "#737373";
-    ctx.font = "12px system-ui, -apple-system, sans-serif";
-    ctx.textAlign = "center";
-
-    // Draw a few time labels
-    const numLabels = Math.min(5, Math.ceil(maxMinutes) + 1);
-    for (let i = 0; i < numLabels; i++) {
-      const minutes = (maxMinutes * i) / (numLabels - 1);
-      const x = padding.left + (i / (numLabels - 1)) * chartWidth;
-      ctx.fillText(`${minutes.toFixed(1)}m`, x, height - 8);
+    return () => cancelAnimationFrame(frame);
+  }, [readings]);
+
+  // Table rows only change when a reading arrives, so build them once per
+  // history update instead of on every render (e.g. while dragging a crop).
+  // Only the newest MAX_TABLE_ROWS are shown, walked from the end of the
+  // history without copying it, and keyed by history index so existing rows
+  // keep their DOM when a reading is appended.
+  const readingRows = useMemo(() => {
+    const rows: React.ReactElement[] = [];
+    const oldest = Math.max(0, readings.length - MAX_TABLE_ROWS);
+    for (let i = readings.length - 1; i >= oldest; i--) {
+      const reading = readings[i];
+      rows.push(
+        <tr key={i} className="border-b border-neutral-100 last:border-0">
+          <td className="py-2 px-4 text-neutral-500 tabular-nums">
+            {new Date(reading.timestamp).toLocaleString()}
+          </td>
+          <td className="py-2 px-4 text-right font-medium tabular-nums">
+            {reading.value}
+          </td>
+        </tr>
+      );
     }
+    return rows;
   }, [readings]);
 
-  // Calculate overlay rectangle style
+  // Calculate overlay rectangle style as percentages of the video frame, so
+  // re-renders don't force a layout read via getBoundingClientRect
   const getOverlayStyle = () => {
-    if (!videoRef.current) return {};
     const video = videoRef.current;
-    const rect = video.getBoundingClientRect();
-    const scaleX = rect.width / video.videoWidth;
-    const scaleY = rect.height / video.videoHeight;
+    if (!video || !video.videoWidth || !video.videoHeight) return null;
+
+    const toStyle = (x: number, y: number, width: number, height: number) => ({
+      left: `${(x / video.videoWidth) * 100}%`,
+      top: `${(y / video.videoHeight) * 100}%`,
+      width: `${(width / video.videoWidth) * 100}%`,
+      height: `${(height / video.videoHeight) * 100}%`,
+    });
 
     if (isSelecting && selectionStart && selectionEnd) {
-      const x = Math.min(selectionStart.x, selectionEnd.x) * scaleX;
-      const y = Math.min(selectionStart.y, selectionEnd.y) * scaleY;
-      const width = Math.abs(selectionEnd.x - selectionStart.x) * scaleX;
-      const height = Math.abs(selectionEnd.y - selectionStart.y) * scaleY;
-      return { left: x, top: y, width, height };
+      return toStyle(
+        Math.min(selectionStart.x, selectionEnd.x),
+        Math.min(selectionStart.y, selectionEnd.y),
+        Math.abs(selectionEnd.x - selectionStart.x),
+        Math.abs(selectionEnd.y - selectionStart.y)
+      );
     }
 
     if (cropRegion) {
-      return {
-        left: cropRegion.x * scaleX,
-        top: cropRegion.y * scaleY,
-        width: cropRegion.width * scaleX,
-        height: cropRegion.height * scaleY,
-      };
+      return toStyle(cropRegion.x, cropRegion.y, cropRegion.width, cropRegion.height);
     }
 
     return null;
@@ -370,12 +891,10 @@ export default function Home() {
   const downloadCSV = () => {
     if (readings.length === 0) return;
 
-    const csvContent = [
-      "timestamp,value",
-      ...readings.map((r) => `${r.timestamp},${r.value}`),
-    ].join("\n");
-
-    const blob = new Blob([csvContent], { type: "text/csv" });
+    // Hand the rows to the Blob as separate parts so a long history isn't
+    // first concatenated into one large string
+    const rows = readings.map((r) => `${r.timestamp},${r.value}\n`);
+    const blob = new Blob(["timestamp,value\n", ...rows], { type: "text/csv" });
     const url = URL.createObjectURL(blob);
     const a = document.createElement("a");
     a.href = url;
@@ -444,6 +963,23 @@ export default function Home() {
                 />
               </div>
 
+              <div className="mb-4">
+                <label className="flex items-center gap-2 text-sm font-medium text-neutral-700">
+                  <input
+                    type="checkbox"
+                    checked={batchMode}
+                    onChange={(e) => setBatchMode(e.target.checked)}
+                  />
+                  Batch mode
+                </label>
+                <p className="mt-1 text-xs text-neutral-500">
+                  Queue captures and submit them to the OpenAI Batch API at half the cost.
+                  Readings are added to the history when the batch completes, within 24 hours.
+                  Queued captures are held in this tab until submitted, so submit them before
+                  closing or reloading the page.
+                </p>
+              </div>
+
               <div className="flex justify-end">
                 <button
                   onClick={() => setShowSettings(false)}
@@ -508,16 +1044,16 @@ export default function Home() {
                 />
               )}
 
-              {/* Loading indicator */}
+              {/* Loading indicator - a small opaque badge rather than a
+                  translucent layer, so the video isn't blended full-frame
+                  for the whole API round trip */}
               {loading && (
-                <div className="absolute inset-0 flex items-center justify-center bg-black/40">
-                  <div className="bg-white px-3 py-1.5 rounded text-sm flex items-center gap-2 text-neutral-700">
-                    <svg className="animate-spin h-4 w-4" fill="none" viewBox="0 0 24 24">
-                      <circle className="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" strokeWidth="4" />
-                      <path className="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z" />
-                    </svg>
-                    Reading...
-                  </div>
+                <div className="absolute top-3 left-3 bg-white px-3 py-1.5 rounded shadow-sm text-sm flex items-center gap-2 text-neutral-700 pointer-events-none">
+                  <svg className="animate-spin h-4 w-4" fill="none" viewBox="0 0 24 24">
+                    <circle className="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" strokeWidth="4" />
+                    <path className="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z" />
+                  </svg>
+                  Reading...
                 </div>
               )}
 
@@ -575,6 +1111,15 @@ export default function Home() {
                   </button>
                 )}
 
+                {pendingCount > 0 && (
+                  <button
+                    onClick={submitBatch}
+                    className="px-4 py-2 bg-white border border-neutral-200 text-neutral-700 hover:bg-neutral-50 rounded-md text-sm font-medium transition-colors"
+                  >
+                    Submit Batch ({pendingCount})
+                  </button>
+                )}
+
                 {readings.length > 0 && (
                   <>
                     <button
@@ -595,6 +1140,19 @@ export default function Home() {
                   </>
                 )}
               </div>
+
+              {pendingCount > 0 && (
+                <p className="text-xs text-neutral-500 text-center mt-4">
+                  {pendingCount} queued {pendingCount === 1 ? "capture" : "captures"} not yet
+                  submitted; they are lost if this page is closed
+                </p>
+              )}
+
+              {batchJobs.length > 0 && (
+                <p className="text-xs text-neutral-500 text-center mt-4">
+                  {batchJobs.length} batch {batchJobs.length === 1 ? "job" : "jobs"} processing
+                </p>
+              )}
             </div>
           </div>
 
@@ -634,18 +1192,14 @@ export default function Home() {
                   </tr>
                 </thead>
                 <tbody>
-                  {[...readings].reverse().map((reading, i) => (
-                    <tr key={i} className="border-b border-neutral-100 last:border-0">
-                      <td className="py-2 px-4 text-neutral-500 tabular-nums">
-                        {new Date(reading.timestamp).toLocaleString()}
-                      </td>
-                      <td className="py-2 px-4 text-right font-medium tabular-nums">
-                        {reading.value}
-                      </td>
-                    </tr>
-                  ))}
+                  {readingRows}
                 </tbody>
               </table>
+              {readings.length > MAX_TABLE_ROWS && (
+                <p className="py-2 px-4 text-xs text-neutral-400 text-center">
+                  Showing the latest {MAX_TABLE_ROWS} of {readings.length} readings. Download the CSV for the full history.
+                </p>
+              )}
             </div>
           </div>
         )}
@@ -0,0 +1,9 @@
+import { startTicker } from "@/lib/ticker";
+
+// Auto-read ticker: given a period (ms), posts a message at each deadline.
+// A new period replaces the running schedule.
+let stop = () => {};
+onmessage = (event: MessageEvent<number>) => {
+  stop();
+  stop = startTicker(event.data, () => postMessage(null));
+};
@@ -0,0 +1,17 @@
+// Call onTick at each monotonic deadline of the given period (ms), skipping
+// any that were missed; returns a function that stops the ticker. Used by the
+// auto-read worker and by the page's main-thread fallback.
+export function startTicker(period: number, onTick: () => void): () => void {
+  let deadline = performance.now() + period;
+  let timer: ReturnType<typeof setTimeout>;
+  const tick = () => {
+    onTick();
+    const now = performance.now();
+    do {
+      deadline += period;
+    } while (deadline <= now);
+    timer = setTimeout(tick, deadline - now);
+  };
+  timer = setTimeout(tick, period);
+  return () => clearTimeout(timer);
+}